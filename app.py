@@ -5,13 +5,21 @@ Author: A-P-U-R-B-O
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
+import os
 
 # Import custom modules
-from utils.matcher import match_scholarships, get_scholarship_statistics, filter_scholarships
+from utils.matcher import (
+    match_scholarships,
+    get_scholarship_statistics,
+    filter_scholarships,
+    build_scholarship_arrays,
+    activate_numba_scorer
+)
 from utils.database import (
     load_scholarships, 
     save_user_profile, 
@@ -21,16 +29,8 @@ from utils.database import (
     update_scholarship_deadlines
 )
 
-# Page configuration
-st.set_page_config(
-    page_title="ScholarMatch - AI Scholarship Finder",
-    page_icon="🎓",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 # Custom CSS for beautiful styling
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 3.5rem;
@@ -127,22 +127,206 @@ st.markdown("""
         box-shadow: 0 4px 8px rgba(102, 126, 234, 0.2);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Deadline card shown in the Deadlines tab
+DEADLINE_CARD = """
+<div class="{css_class}">
+    <strong>{name}</strong><br>
+    💰 {amount} • ⏰ {deadline_days} days left • Due: {deadline}
+</div>
+"""
+
+# Profile form options
+GRADE_LEVELS = (
+    "High School Freshman",
+    "High School Sophomore",
+    "High School Junior",
+    "High School Senior",
+    "College Freshman",
+    "College Sophomore",
+    "College Junior",
+    "College Senior",
+    "Graduate Student"
+)
+
+MAJORS = (
+    "STEM",
+    "Engineering",
+    "Business",
+    "Arts & Humanities",
+    "Social Sciences",
+    "Medicine",
+    "Education",
+    "Undecided"
+)
+
+STATES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
+    "Connecticut", "Delaware", "Florida", "Georgia", "Hawaii", "Idaho",
+    "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana",
+    "Maine", "Maryland", "Massachusetts", "Michigan", "Minnesota",
+    "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada",
+    "New Hampshire", "New Jersey", "New Mexico", "New York",
+    "North Carolina", "North Dakota", "Ohio", "Oklahoma", "Oregon",
+    "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota",
+    "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington",
+    "West Virginia", "Wisconsin", "Wyoming"
+)
+
+ETHNICITIES = (
+    "African American",
+    "Hispanic/Latino",
+    "Asian American",
+    "Native American",
+    "Pacific Islander",
+    "White",
+    "Other"
+)
+
+GENDERS = (
+    "Prefer not to say",
+    "Male",
+    "Female",
+    "Other"
+)
+
+INTERESTS = (
+    "Sports",
+    "Community Service",
+    "STEM Clubs",
+    "Arts/Music",
+    "Student Government",
+    "Entrepreneurship",
+    "Writing",
+    "Debate"
+)
+
+SPECIAL_CIRCUMSTANCES = (
+    "First Generation College Student",
+    "Military Family",
+    "Financial Need",
+    "Disability",
+    "None"
+)
+
+# Page configuration
+st.set_page_config(
+    page_title="ScholarMatch - AI Scholarship Finder",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Apply custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Initialize session state
 if 'matches' not in st.session_state:
     st.session_state.matches = []
+if 'matches_df' not in st.session_state:
+    st.session_state.matches_df = None
 if 'user_profile' not in st.session_state:
     st.session_state.user_profile = {}
 if 'scholarships_loaded' not in st.session_state:
     st.session_state.scholarships_loaded = False
 
-# Load scholarships (cached)
-@st.cache_data
+SCHOLARSHIPS_FILE = "data/scholarships.json"
+
+# Load scholarships with fresh deadlines once per day and data file version (shared by reference, never hashed)
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_scholarships(today, mtime):
+    # Plain records, not a DataFrame round trip: missing optional fields must stay missing, not NaN
+    scholarships = update_scholarship_deadlines(load_scholarships(SCHOLARSHIPS_FILE))
+    # Use the JIT-compiled scorer when numba is installed (a no-op once it is active);
+    # the serial kernel, since every session scores from its own script thread
+    activate_numba_scorer(parallel=False)
+    return build_scholarship_arrays(scholarships)
+
 def load_scholarship_data():
-    scholarships = load_scholarships()
-    scholarships = update_scholarship_deadlines(scholarships)
-    return scholarships
+    try:
+        mtime = os.path.getmtime(SCHOLARSHIPS_FILE)
+    except OSError:
+        mtime = None
+    return _load_scholarships(datetime.utcnow().date(), mtime)
+
+# Format a scholarship amount for display: numbers as dollars, text (e.g. "Varies") as is
+def format_amount(amount):
+    if isinstance(amount, str):
+        return amount or "Varies"
+    return f"${amount:,.0f}" if amount is not None and pd.notna(amount) else "Varies"
+
+# Render a group of deadline cards with a single markdown call
+def render_deadline_cards(title, css_class, scholarships_df):
+    st.markdown(title)
+    cards = "".join(
+        DEADLINE_CARD.format(
+            css_class=css_class,
+            name=row.name,
+            amount=format_amount(row.amount),
+            deadline_days=row.deadline_days,
+            deadline=row.deadline if pd.notna(row.deadline) else 'TBD'
+        )
+        for row in scholarships_df.itertuples()
+    )
+    st.markdown(cards, unsafe_allow_html=True)
+
+# Analytics charts, cached on their (hashable) input data so reruns skip rebuilding the figures
+@st.cache_data(max_entries=64, show_spinner=False)
+def amount_histogram(amounts):
+    fig = px.histogram(
+        list(amounts), 
+        nbins=10, 
+        title="Scholarship Amount Distribution (Top 30)",
+        labels={'value': 'Amount ($)', 'count': 'Number of Scholarships'},
+        color_discrete_sequence=['#667eea']
+    )
+    fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def category_pie(categories):
+    return px.pie(
+        values=[count for _, count in categories], 
+        names=[cat for cat, _ in categories],
+        title="Scholarships by Category (Top 30)",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def match_score_histogram(match_scores):
+    fig = px.histogram(
+        list(match_scores),
+        nbins=10,
+        title="How Well Scholarships Match Your Profile",
+        labels={'value': 'Match Score (%)', 'count': 'Number of Scholarships'},
+        color_discrete_sequence=['#f59e0b']
+    )
+    fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+# CSV export of the results table, only re-serialized when the table changes
+@st.cache_data(max_entries=16, show_spinner=False)
+def results_csv(results_df):
+    return results_df.to_csv(index=False).encode('utf-8')
+
+# Build the DataFrame that every stat, chart and table below is derived from
+def build_matches_frame(matches):
+    if not matches:
+        return None
+    df = pd.DataFrame([m['scholarship'] for m in matches])
+    df['match_score'] = [m['match_score'] for m in matches]
+    # Numeric amounts for sums, charts and filters; the scholarship records keep the original values
+    df['amount'] = pd.to_numeric(df['amount'], errors='coerce') if 'amount' in df else np.nan
+    df['deadline_days'] = df['deadline_days'].fillna(999).astype(int)
+    df['category'] = df['category'].fillna('General')
+    
+    # Match quality badge and emoji for the Top Matches tab
+    high = df['match_score'] >= 80
+    medium = df['match_score'] >= 60
+    df['tier'] = np.select([high, medium], ['match-high', 'match-medium'], default='match-low')
+    df['emoji'] = np.select([high, medium], ['🟢', '🟡'], default='🟠')
+    return df
 
 # Main app header
 st.markdown('<p class="main-header">🎓 ScholarMatch</p>', unsafe_allow_html=True)
@@ -160,81 +344,23 @@ with st.sidebar.form("profile_form"):
     st.markdown("### 📚 Academic Information")
     gpa = st.slider("GPA (4.0 scale)", 0.0, 4.0, 3.5, 0.1)
     
-    grade_level = st.selectbox("Grade Level *", [
-        "High School Freshman",
-        "High School Sophomore", 
-        "High School Junior",
-        "High School Senior",
-        "College Freshman",
-        "College Sophomore",
-        "College Junior",
-        "College Senior",
-        "Graduate Student"
-    ])
+    grade_level = st.selectbox("Grade Level *", GRADE_LEVELS)
     
-    major = st.selectbox("Field of Study *", [
-        "STEM",
-        "Engineering",
-        "Business",
-        "Arts & Humanities",
-        "Social Sciences",
-        "Medicine",
-        "Education",
-        "Undecided"
-    ])
+    major = st.selectbox("Field of Study *", MAJORS)
     
     st.markdown("### 📍 Location")
-    state = st.selectbox("State *", [
-        "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
-        "Connecticut", "Delaware", "Florida", "Georgia", "Hawaii", "Idaho",
-        "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana",
-        "Maine", "Maryland", "Massachusetts", "Michigan", "Minnesota",
-        "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada",
-        "New Hampshire", "New Jersey", "New Mexico", "New York",
-        "North Carolina", "North Dakota", "Ohio", "Oklahoma", "Oregon",
-        "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota",
-        "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington",
-        "West Virginia", "Wisconsin", "Wyoming"
-    ])
+    state = st.selectbox("State *", STATES)
     
     st.markdown("### 🌈 Demographics (Optional)")
-    ethnicity = st.multiselect("Ethnicity", [
-        "African American",
-        "Hispanic/Latino",
-        "Asian American",
-        "Native American",
-        "Pacific Islander",
-        "White",
-        "Other"
-    ])
+    ethnicity = st.multiselect("Ethnicity", ETHNICITIES)
     
-    gender = st.selectbox("Gender", [
-        "Prefer not to say",
-        "Male",
-        "Female",
-        "Other"
-    ])
+    gender = st.selectbox("Gender", GENDERS)
     
     st.markdown("### 🎯 Interests & Activities")
-    interests = st.multiselect("Select all that apply", [
-        "Sports",
-        "Community Service",
-        "STEM Clubs",
-        "Arts/Music",
-        "Student Government",
-        "Entrepreneurship",
-        "Writing",
-        "Debate"
-    ])
+    interests = st.multiselect("Select all that apply", INTERESTS)
     
     st.markdown("### ⭐ Special Circumstances")
-    special_circumstances = st.multiselect("Select if applicable", [
-        "First Generation College Student",
-        "Military Family",
-        "Financial Need",
-        "Disability",
-        "None"
-    ])
+    special_circumstances = st.multiselect("Select if applicable", SPECIAL_CIRCUMSTANCES)
     
     submit_button = st.form_submit_button("🔍 Find My Scholarships!", use_container_width=True)
 
@@ -268,11 +394,18 @@ if submit_button:
         
         # Load scholarships
         with st.spinner("🔍 Searching through 60+ scholarships..."):
-            scholarships = load_scholarship_data()
+            scholarship_arrays = load_scholarship_data()
             
             # Match scholarships
-            matches = match_scholarships(user_profile, scholarships, min_match_threshold=40)
+            matches = match_scholarships(user_profile, scholarship_arrays, min_match_threshold=40)
+            
+            # Trim display-only lists once instead of on every rerun (on the match, never the shared scholarship)
+            for m in matches:
+                m['match_reasons'] = tuple(m['match_reasons'])[:5]
+                m['requirements'] = tuple(m['scholarship'].get('requirements') or ('See website for details',))
+            
             st.session_state.matches = matches
+            st.session_state.matches_df = build_matches_frame(matches)
         
         st.success(f"✅ Found {len(matches)} scholarships matching your profile, {name}!")
         st.balloons()
@@ -280,6 +413,7 @@ if submit_button:
 # Display results if matches exist
 if st.session_state.matches:
     matches = st.session_state.matches
+    matches_df = st.session_state.matches_df
     
     # Top statistics
     st.markdown("---")
@@ -296,7 +430,7 @@ if st.session_state.matches:
         """, unsafe_allow_html=True)
     
     with col2:
-        total_value = sum([s.get('amount', 0) for s in matches[:10] if isinstance(s.get('amount'), (int, float))])
+        total_value = int(matches_df['amount'].head(10).sum())
         st.markdown(f"""
             <div class="stat-box">
                 <p class="stat-number">${total_value:,}</p>
@@ -305,7 +439,7 @@ if st.session_state.matches:
         """, unsafe_allow_html=True)
     
     with col3:
-        avg_match = sum([s.get('match_score', 0) for s in matches]) / len(matches) if matches else 0
+        avg_match = matches_df['match_score'].mean()
         st.markdown(f"""
             <div class="stat-box">
                 <p class="stat-number">{int(avg_match)}%</p>
@@ -314,7 +448,7 @@ if st.session_state.matches:
         """, unsafe_allow_html=True)
     
     with col4:
-        urgent = len([s for s in matches if s.get('deadline_days', 999) < 30])
+        urgent = int((matches_df['deadline_days'] < 30).sum())
         st.markdown(f"""
             <div class="stat-box">
                 <p class="stat-number">{urgent}</p>
@@ -332,31 +466,22 @@ if st.session_state.matches:
         st.markdown("These scholarships are ranked by how well they match your profile!")
         
         # Display top 15 matches
-        for idx, scholarship in enumerate(matches[:15], 1):
-            match_score = scholarship.get('match_score', 0)
-            
-            # Determine match quality
-            if match_score >= 80:
-                badge_class = "match-high"
-                emoji = "🟢"
-            elif match_score >= 60:
-                badge_class = "match-medium"
-                emoji = "🟡"
-            else:
-                badge_class = "match-low"
-                emoji = "🟠"
+        top_matches = zip(matches[:15], matches_df['tier'], matches_df['emoji'])
+        for idx, (match, badge_class, emoji) in enumerate(top_matches, 1):
+            scholarship = match['scholarship']
+            match_score = match['match_score']
             
             with st.expander(f"{emoji} **#{idx} - {scholarship['name']}** - {match_score}% Match"):
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
-                    st.markdown(f"**💰 Amount:** ${scholarship.get('amount', 'Varies'):,}" if isinstance(scholarship.get('amount'), (int, float)) else f"**💰 Amount:** {scholarship.get('amount', 'Varies')}")
+                    st.markdown(f"**💰 Amount:** {format_amount(scholarship.get('amount'))}")
                     st.markdown(f"**📅 Deadline:** {scholarship.get('deadline', 'Rolling')}")
                     st.markdown(f"**📝 Category:** {scholarship.get('category', 'General')}")
-                    st.markdown(f"**📖 Description:** {scholarship.get('description', 'No description available')}")
+                    st.markdown(f"**📖 Description:** {scholarship.get('description') or 'No description available'}")
                     
                     st.markdown("**✅ Requirements:**")
-                    for req in scholarship.get('requirements', ['See website for details']):
+                    for req in match['requirements']:
                         st.markdown(f"• {req}")
                 
                 with col2:
@@ -366,7 +491,7 @@ if st.session_state.matches:
                     st.markdown(f"<span class='match-badge {badge_class}'>{match_score}%</span>", unsafe_allow_html=True)
                     
                     st.markdown("**Why You Match:**")
-                    for reason in scholarship.get('match_reasons', [])[:5]:
+                    for reason in match['match_reasons']:
                         st.markdown(f"{reason}")
                     
                     # Deadline urgency
@@ -388,52 +513,30 @@ if st.session_state.matches:
         
         with col1:
             # Amount distribution
-            amounts = [s.get('amount', 0) for s in matches[:30] if isinstance(s.get('amount'), (int, float))]
+            amounts = tuple(matches_df['amount'].head(30).dropna().tolist())
             if amounts:
-                fig = px.histogram(
-                    amounts, 
-                    nbins=10, 
-                    title="Scholarship Amount Distribution (Top 30)",
-                    labels={'value': 'Amount ($)', 'count': 'Number of Scholarships'},
-                    color_discrete_sequence=['#667eea']
-                )
-                fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(amount_histogram(amounts), use_container_width=True)
         
         with col2:
             # Category breakdown pie chart
-            categories = {}
-            for s in matches[:30]:
-                cat = s.get('category', 'General')
-                categories[cat] = categories.get(cat, 0) + 1
-            
-            fig2 = px.pie(
-                values=list(categories.values()), 
-                names=list(categories.keys()),
-                title="Scholarships by Category (Top 30)",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            st.plotly_chart(fig2, use_container_width=True)
+            categories = matches_df['category'].head(30).value_counts(sort=False).to_dict()
+            st.plotly_chart(category_pie(tuple(categories.items())), use_container_width=True)
         
         # Match score distribution
         st.markdown("#### Match Score Distribution")
-        match_scores = [s.get('match_score', 0) for s in matches]
-        fig3 = px.histogram(
-            match_scores,
-            nbins=10,
-            title="How Well Scholarships Match Your Profile",
-            labels={'value': 'Match Score (%)', 'count': 'Number of Scholarships'},
-            color_discrete_sequence=['#f59e0b']
-        )
-        fig3.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
-        st.plotly_chart(fig3, use_container_width=True)
+        match_scores = tuple(matches_df['match_score'].tolist())
+        st.plotly_chart(match_score_histogram(match_scores), use_container_width=True)
         
         # Top categories table
         st.markdown("#### Category Breakdown")
-        category_df = pd.DataFrame([
-            {"Category": cat, "Count": count, "Avg Amount": f"${sum([s.get('amount', 0) for s in matches if s.get('category') == cat and isinstance(s.get('amount'), (int, float))]) // max(count, 1):,}"}
-            for cat, count in categories.items()
-        ]).sort_values('Count', ascending=False)
+        category_df = (
+            matches_df.head(30)
+            .groupby('category', as_index=False, sort=False)
+            .agg(Count=('name', 'size'), AvgAmount=('amount', 'mean'))
+            .sort_values('Count', ascending=False, kind='stable')
+        )
+        category_df['AvgAmount'] = category_df['AvgAmount'].map(format_amount)
+        category_df = category_df.rename(columns={'category': 'Category', 'AvgAmount': 'Avg Amount'})
         st.dataframe(category_df, use_container_width=True, hide_index=True)
     
     with tab3:
@@ -441,101 +544,78 @@ if st.session_state.matches:
         st.markdown("Stay on track with these important dates!")
         
         # Sort by deadline
-        deadline_sorted = sorted(
-            [s for s in matches if s.get('deadline_days') is not None],
-            key=lambda x: x.get('deadline_days', 999)
-        )
-        
-        # Group by urgency
-        critical = [s for s in deadline_sorted if s.get('deadline_days', 999) < 7]
-        urgent = [s for s in deadline_sorted if 7 <= s.get('deadline_days', 999) < 30]
-        upcoming = [s for s in deadline_sorted if 30 <= s.get('deadline_days', 999) < 90]
+        deadline_sorted = matches_df.sort_values('deadline_days', kind='stable')
         
-        if critical:
-            st.markdown("#### 🚨 Critical - Due This Week!")
-            for s in critical:
-                st.markdown(f"""
-                    <div class="deadline-critical">
-                        <strong>{s['name']}</strong><br>
-                        💰 ${s.get('amount', 'Varies'):,} • ⏰ {s.get('deadline_days', '?')} days left • Due: {s.get('deadline', 'TBD')}
-                    </div>
-                """, unsafe_allow_html=True)
-        
-        if urgent:
-            st.markdown("#### ⚠️ Urgent - Due This Month")
-            for s in urgent:
-                st.markdown(f"""
-                    <div class="deadline-warning">
-                        <strong>{s['name']}</strong><br>
-                        💰 ${s.get('amount', 'Varies'):,} • ⏰ {s.get('deadline_days', '?')} days left • Due: {s.get('deadline', 'TBD')}
-                    </div>
-                """, unsafe_allow_html=True)
+        # Group by urgency in a single pass
+        buckets = pd.cut(
+            deadline_sorted['deadline_days'],
+            [-np.inf, 7, 30, 90, np.inf],
+            right=False,
+            labels=['critical', 'urgent', 'upcoming', 'later']
+        )
+        sections = {
+            'critical': ("#### 🚨 Critical - Due This Week!", "deadline-critical", None),
+            'urgent': ("#### ⚠️ Urgent - Due This Month", "deadline-warning", None),
+            'upcoming': ("#### 📌 Upcoming - Next 3 Months", "deadline-info", 10)
+        }
         
-        if upcoming:
-            st.markdown("#### 📌 Upcoming - Next 3 Months")
-            for s in upcoming[:10]:
-                st.markdown(f"""
-                    <div class="deadline-info">
-                        <strong>{s['name']}</strong><br>
-                        💰 ${s.get('amount', 'Varies'):,} • ⏰ {s.get('deadline_days', '?')} days left • Due: {s.get('deadline', 'TBD')}
-                    </div>
-                """, unsafe_allow_html=True)
+        for bucket, group in deadline_sorted.groupby(buckets, observed=True):
+            if bucket in sections:
+                title, css_class, limit = sections[bucket]
+                render_deadline_cards(title, css_class, group.iloc[:limit])
     
     with tab4:
         st.markdown("### 🔍 All Matched Scholarships")
         
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            categories = ['All'] + sorted(list(set([s.get('category', 'General') for s in matches])))
-            category_filter = st.selectbox("Filter by Category", categories)
-        
-        with col2:
-            min_amount = st.number_input("Min Amount ($)", min_value=0, value=0, step=500)
-        
-        with col3:
-            deadline_filter = st.selectbox("Deadline", ["All", "This Week", "This Month", "This Quarter"])
+        # Filters (inside a form so changing them does not rerun the app until applied)
+        with st.form("results_filters"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                categories = ['All'] + sorted(matches_df['category'].unique())
+                category_filter = st.selectbox("Filter by Category", categories)
+            
+            with col2:
+                min_amount = st.number_input("Min Amount ($)", min_value=0, value=0, step=500)
+            
+            with col3:
+                deadline_filter = st.selectbox("Deadline", ["All", "This Week", "This Month", "This Quarter"])
+            
+            st.form_submit_button("Apply Filters")
         
-        # Apply filters
-        filtered_matches = matches.copy()
+        # Apply filters as a single boolean mask
+        mask = np.ones(len(matches_df), dtype=bool)
         
         if category_filter != 'All':
-            filtered_matches = [s for s in filtered_matches if s.get('category') == category_filter]
+            mask &= (matches_df['category'] == category_filter).to_numpy()
         
         if min_amount > 0:
-            filtered_matches = [s for s in filtered_matches if isinstance(s.get('amount'), (int, float)) and s.get('amount', 0) >= min_amount]
+            mask &= (matches_df['amount'] >= min_amount).to_numpy()
         
-        if deadline_filter == "This Week":
-            filtered_matches = [s for s in filtered_matches if s.get('deadline_days', 999) < 7]
-        elif deadline_filter == "This Month":
-            filtered_matches = [s for s in filtered_matches if s.get('deadline_days', 999) < 30]
-        elif deadline_filter == "This Quarter":
-            filtered_matches = [s for s in filtered_matches if s.get('deadline_days', 999) < 90]
+        deadline_limits = {"This Week": 7, "This Month": 30, "This Quarter": 90}
+        if deadline_filter in deadline_limits:
+            mask &= (matches_df['deadline_days'] < deadline_limits[deadline_filter]).to_numpy()
         
-        st.markdown(f"**Showing {len(filtered_matches)} scholarships**")
+        filtered = matches_df.loc[mask]
+        
+        st.markdown(f"**Showing {len(filtered)} scholarships**")
         
         # Display as table
-        if filtered_matches:
-            table_data = []
-            for s in filtered_matches:
-                table_data.append({
-                    "Scholarship": s['name'],
-                    "Amount": f"${s.get('amount', 0):,}" if isinstance(s.get('amount'), (int, float)) else str(s.get('amount', 'Varies')),
-                    "Match": f"{s.get('match_score', 0)}%",
-                    "Deadline": s.get('deadline', 'Rolling'),
-                    "Days Left": s.get('deadline_days', '?'),
-                    "Category": s.get('category', 'General')
-                })
-            
-            df = pd.DataFrame(table_data)
+        if len(filtered):
+            df = pd.DataFrame({
+                "Scholarship": filtered['name'],
+                "Amount": filtered['amount'].map(format_amount),
+                "Match": filtered['match_score'].astype(str) + "%",
+                "Deadline": filtered['deadline'].fillna('Rolling'),
+                "Days Left": filtered['deadline_days'],
+                "Category": filtered['category']
+            })
             st.dataframe(df, use_container_width=True, hide_index=True)
             
             # Download button
-            csv = df.to_csv(index=False)
             st.download_button(
                 label="📥 Download Results as CSV",
-                data=csv,
+                data=results_csv(df),
                 file_name="scholarMatch_results.csv",
                 mime="text/csv"
             )
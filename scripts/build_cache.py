@@ -0,0 +1,16 @@
+"""
+ScholarMatch - Build the pre-parsed scholarships cache
+Run from the project root: python scripts/build_cache.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import build_scholarships_cache
+
+
+if __name__ == "__main__":
+    if not build_scholarships_cache():
+        sys.exit(1)
@@ -4,15 +4,95 @@ Handles loading and saving scholarship and user data
 """
 
 import json
+import mmap
 import os
+import pickle
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import random
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+
+# numpy is imported where it is used so that plain JSON loading
+# (e.g. scripts/build_cache.py) does not pay for importing it
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Files larger than this are memory-mapped rather than read into a bytes buffer
+MMAP_THRESHOLD = 1 << 20
+
+
+def _load_json_file(f) -> Any:
+    """
+    Parse an open binary JSON file
+    Large files are memory-mapped so orjson parses straight from the page cache
+    instead of from a copy of the file; small files are cheaper to just read
+    """
+    if orjson is not None and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    return _json_loads(f.read())
+
+
+def _json_dumps(obj: Any, compact: bool = False) -> bytes:
+    """
+    Serialize obj as UTF-8 JSON, using orjson when it is installed
+    Output is 2-space indented unless compact is True
+    """
+    if orjson is not None:
+        return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(filepath: str, data: bytes) -> None:
+    """
+    Replace filepath with data in one step
+    The bytes go to a temporary sibling file that is fsynced and then renamed over
+    filepath, so readers (and a crash) never see a half-written file
+    """
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _json_line(obj: Any) -> bytes:
+    """
+    Serialize obj as a single newline-terminated line of UTF-8 JSON (one NDJSON record)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b"\n"
 
 
 def load_scholarships(filepath: str = "data/scholarships.json") -> List[Dict[str, Any]]:
     """
     Load scholarships from JSON file
+    A pre-parsed pickle cache (see build_scholarships_cache) is used when it is up to date
     If file doesn't exist, create sample data
     
     Args:
@@ -21,17 +101,20 @@ def load_scholarships(filepath: str = "data/scholarships.json") -> List[Dict[str
     Returns:
         List of scholarship dictionaries
     """
+    cached = _load_scholarships_cache(filepath)
+    if cached is not None:
+        return cached
+    
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                scholarships = json.load(f)
-                print(f"✅ Loaded {len(scholarships)} scholarships from {filepath}")
-                return scholarships
-        else:
-            print(f"⚠️ File {filepath} not found. Creating sample data...")
-            scholarships = generate_sample_scholarships()
-            save_scholarships(scholarships, filepath)
-            return scholarships
+        with open(filepath, 'rb') as f:
+            scholarships = _load_json_file(f)
+        print(f"✅ Loaded {len(scholarships)} scholarships from {filepath}")
+        return scholarships
+    except FileNotFoundError:
+        print(f"⚠️ File {filepath} not found. Creating sample data...")
+        scholarships = generate_sample_scholarships()
+        save_scholarships(scholarships, filepath)
+        return scholarships
     except json.JSONDecodeError as e:
         print(f"❌ Error decoding JSON: {e}")
         print("Creating sample data instead...")
@@ -43,21 +126,133 @@ def load_scholarships(filepath: str = "data/scholarships.json") -> List[Dict[str
         return []
 
 
-def save_scholarships(scholarships: List[Dict[str, Any]], filepath: str = "data/scholarships.json") -> bool:
+def scholarships_cache_path(filepath: str = "data/scholarships.json") -> str:
+    """
+    Path of the pickle cache that sits next to a scholarships JSON file
+    """
+    return os.path.splitext(filepath)[0] + ".pkl"
+
+
+def build_scholarships_cache(filepath: str = "data/scholarships.json") -> str:
+    """
+    Parse the scholarships JSON once and store the result as a pickle cache
+    
+    Args:
+        filepath: Path to scholarships JSON file
+    
+    Returns:
+        Filepath of the cache, or "" if the JSON could not be read
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            scholarships = _load_json_file(f)
+        
+        cache_path = scholarships_cache_path(filepath)
+        _write_atomic(cache_path, pickle.dumps(scholarships, protocol=pickle.HIGHEST_PROTOCOL))
+        
+        print(f"✅ Cached {len(scholarships)} scholarships to {cache_path}")
+        return cache_path
+    except Exception as e:
+        print(f"❌ Error building scholarships cache: {e}")
+        return ""
+
+
+def _load_scholarships_cache(filepath: str):
+    """
+    Load the pickle cache for filepath, or None if it is missing or older than the JSON
+    """
+    cache_path = scholarships_cache_path(filepath)
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+            return None
+        with open(cache_path, 'rb') as f:
+            scholarships = pickle.loads(f.read())
+        print(f"✅ Loaded {len(scholarships)} scholarships from {cache_path}")
+        return scholarships
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _parse_date(date_str: str) -> datetime:
+    """
+    Equivalent of datetime.strptime(date_str, "%Y-%m-%d")
+    Plain YYYY-MM-DD strings take the much faster fromisoformat path
+    """
+    if (isinstance(date_str, str) and len(date_str) == 10
+            and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    # strptime also accepts forms like "2025-1-5" and raises the usual errors
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def _parse_deadline(deadline_str: Any) -> Optional[datetime]:
+    """
+    Parse one YYYY-MM-DD string, None if it is not a valid date
+    """
+    try:
+        return _parse_date(deadline_str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _deadline_days_array(deadlines: List[Any], today: Optional[datetime] = None) -> "np.ndarray":
+    """
+    Vectorized calculate_deadline_days over a list of YYYY-MM-DD strings
+    
+    Args:
+        deadlines: Deadline strings
+        today: Reference time (defaults to datetime.utcnow())
+    
+    Returns:
+        int64 array of days until each deadline (0 if passed, 999 if unparseable)
+    """
+    import numpy as np
+    
+    # numpy also accepts partial dates like "2025-01", so only take the fast
+    # path when every value has the exact YYYY-MM-DD length
+    dates = None
+    if all(isinstance(d, str) and len(d) == 10 for d in deadlines):
+        try:
+            dates = np.array(deadlines, dtype='datetime64[D]')
+        except ValueError:
+            pass
+    if dates is None:
+        dates = np.array([_parse_deadline(d) for d in deadlines], dtype='datetime64[D]')
+    
+    invalid = np.isnat(dates)
+    if invalid.any():
+        print(f"⚠️ Error calculating deadline for {int(invalid.sum())} scholarships")
+    
+    # Whole days from now until the deadline's midnight, rounded down like timedelta.days
+    now = np.datetime64(today if today is not None else datetime.utcnow(), 'us')
+    with np.errstate(invalid='ignore'):
+        days = (dates.astype('datetime64[us]') - now) // np.timedelta64(1, 'D')
+    days = np.maximum(days, 0)
+    days[invalid] = 999
+    return days
+
+
+def save_scholarships(scholarships: List[Dict[str, Any]], filepath: str = "data/scholarships.json",
+                      compact: bool = False) -> bool:
     """
     Save scholarships to JSON file
     
     Args:
         scholarships: List of scholarship dictionaries
         filepath: Path to save JSON file
+        compact: Write without indentation (smaller, for machine consumption)
     
     Returns:
         True if successful, False otherwise
     """
     try:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(scholarships, f, indent=2, ensure_ascii=False)
+        _write_atomic(filepath, _json_dumps(scholarships, compact=compact))
+        _clear_scholarship_caches()
         print(f"✅ Saved {len(scholarships)} scholarships to {filepath}")
         return True
     except Exception as e:
@@ -65,60 +260,186 @@ def save_scholarships(scholarships: List[Dict[str, Any]], filepath: str = "data/
         return False
 
 
-def load_users(filepath: str = "data/users.json") -> List[Dict[str, Any]]:
+# User profiles are stored one JSON object per line so saving a profile only
+# appends to the file; a users.json array from older versions is still readable
+USERS_FILE = "data/users.ndjson"
+
+# Parsed users files keyed by absolute path: (st_mtime_ns, st_size, users, email_index)
+_users_cache: Dict[str, tuple] = {}
+
+# Serializes append_user within the process (Streamlit sessions are threads sharing _users_cache)
+_users_lock = threading.Lock()
+
+
+def _build_email_index(users: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map lowercased email -> user profile (the first profile wins on duplicates)
+    """
+    index = {}
+    for user in users:
+        index.setdefault(user.get('email', '').lower(), user)
+    return index
+
+
+def _cache_users(filepath: str, users: List[Dict[str, Any]],
+                 email_index: Dict[str, Dict[str, Any]] = None) -> None:
+    """
+    Remember users (and their email index) as the current contents of filepath
+    """
+    if email_index is None:
+        email_index = _build_email_index(users)
+    st = os.stat(filepath)
+    _users_cache[os.path.abspath(filepath)] = (st.st_mtime_ns, st.st_size, users, email_index)
+
+
+def _is_ndjson(filepath: str) -> bool:
+    return filepath.endswith('.ndjson')
+
+
+def _load_users_entry(filepath: str) -> tuple:
+    """
+    Return the cache entry (st_mtime_ns, st_size, users, email_index) for filepath,
+    re-parsing the file only when its mtime or size changed
+    A .ndjson path that does not exist yet falls back to the legacy users.json next to it
+    
+    Raises:
+        FileNotFoundError: If neither file exists
+    """
+    source = filepath
+    try:
+        f = open(filepath, 'rb')
+    except FileNotFoundError:
+        if not _is_ndjson(filepath):
+            raise
+        source = os.path.splitext(filepath)[0] + ".json"
+        f = open(source, 'rb')
+    
+    key = os.path.abspath(source)
+    with f:
+        st = os.fstat(f.fileno())
+        cached = _users_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached
+        data = f.read()
+    
+    if _is_ndjson(source):
+        users = [_json_loads(line) for line in data.splitlines() if line.strip()]
+    else:
+        users = _json_loads(data)
+    entry = (st.st_mtime_ns, st.st_size, users, _build_email_index(users))
+    _users_cache[key] = entry
+    print(f"✅ Loaded {len(users)} user profiles")
+    return entry
+
+
+def load_users(filepath: str = USERS_FILE) -> List[Dict[str, Any]]:
     """
-    Load user profiles from JSON file
+    Load user profiles from an NDJSON file (or a legacy JSON array file)
+    The parsed list is cached and only re-read when the file's mtime or size changes
     
     Args:
-        filepath: Path to users JSON file
+        filepath: Path to users file
     
     Returns:
         List of user profile dictionaries
     """
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                users = json.load(f)
-                print(f"✅ Loaded {len(users)} user profiles")
-                return users
-        else:
+        try:
+            return _load_users_entry(filepath)[2]
+        except FileNotFoundError:
             print(f"ℹ️ No existing users file. Creating new one...")
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+            with open(filepath, 'wb') as f:
+                f.write(b"" if _is_ndjson(filepath) else b"[]")
             return []
     except Exception as e:
         print(f"❌ Error loading users: {e}")
         return []
 
 
-def save_user_profile(profile: Dict[str, Any], filepath: str = "data/users.json") -> bool:
+load_users.cache_clear = _users_cache.clear
+
+
+def append_user(profile: Dict[str, Any], users: List[Dict[str, Any]],
+                filepath: str = USERS_FILE) -> List[Dict[str, Any]]:
     """
-    Save user profile to JSON file (appends to existing profiles)
+    Append a profile to the users file and return the updated list
+    NDJSON files only get the new line appended; legacy JSON files are rewritten
+    The file is only re-parsed if it changed since it was cached, and the cache is
+    extended in place only if nothing else wrote the file in between
     
     Args:
         profile: User profile dictionary
-        filepath: Path to users JSON file
+        users: Users list the caller loaded (e.g. from load_users); if the file has
+            changed since, its current contents are used instead
+        filepath: Path to users file
     
     Returns:
-        True if successful, False otherwise
+        New list of user profiles including the appended profile
     """
-    try:
-        # Load existing profiles
-        users = load_users(filepath)
+    with _users_lock:
+        # The id must come from what is on disk now, not from a list another session made stale
+        try:
+            users = _load_users_entry(filepath)[2]
+        except FileNotFoundError:
+            pass
         
         # Add timestamp
         profile['created_at'] = datetime.utcnow().isoformat()
         profile['id'] = len(users) + 1
         
-        # Append new profile
-        users.append(profile)
+        # Append to a copy so users is untouched if the save fails
+        updated = users + [profile]
         
-        # Save back to file
+        # Save to file
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(users, f, indent=2, ensure_ascii=False)
+        if _is_ndjson(filepath):
+            try:
+                # First write, e.g. users migrated from a legacy users.json
+                with open(filepath, 'xb') as f:
+                    f.write(b"".join(_json_line(user) for user in updated))
+            except FileExistsError:
+                line = _json_line(profile)
+                with open(filepath, 'ab') as f:
+                    before = os.fstat(f.fileno())
+                    f.write(line)
+                
+                abspath = os.path.abspath(filepath)
+                entry = _users_cache.get(abspath)
+                st = os.stat(filepath)
+                if (entry is not None and entry[2] is users
+                        and entry[:2] == (before.st_mtime_ns, before.st_size)
+                        and st.st_size == before.st_size + len(line)):
+                    # Extend the existing email index instead of rebuilding it
+                    email_index = entry[3]
+                    email_index.setdefault(profile.get('email', '').lower(), profile)
+                    _users_cache[abspath] = (st.st_mtime_ns, st.st_size, updated, email_index)
+                else:
+                    # Another process wrote the file too; the next load re-reads it
+                    _users_cache.pop(abspath, None)
+                return updated
+        else:
+            _write_atomic(filepath, _json_dumps(updated))
         
+        # The whole file was just written from updated
+        _cache_users(filepath, updated)
+    
+    return updated
+
+
+def save_user_profile(profile: Dict[str, Any], filepath: str = USERS_FILE) -> bool:
+    """
+    Save user profile to the users file (appends to existing profiles)
+    
+    Args:
+        profile: User profile dictionary
+        filepath: Path to users file
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        append_user(profile, load_users(filepath), filepath)
         print(f"✅ Saved user profile for {profile.get('name', 'Unknown')}")
         return True
     except Exception as e:
@@ -126,22 +447,24 @@ def save_user_profile(profile: Dict[str, Any], filepath: str = "data/users.json"
         return False
 
 
-def get_user_by_email(email: str, filepath: str = "data/users.json") -> Dict[str, Any]:
+def get_user_by_email(email: str, filepath: str = USERS_FILE) -> Dict[str, Any]:
     """
     Retrieve user profile by email
     
     Args:
         email: User's email address
-        filepath: Path to users JSON file
+        filepath: Path to users file
     
     Returns:
         User profile dictionary or None if not found
     """
-    users = load_users(filepath)
-    for user in users:
-        if user.get('email', '').lower() == email.lower():
-            return user
-    return None
+    try:
+        entry = _load_users_entry(filepath)
+    except Exception:
+        # Let load_users report the problem (and create a missing file)
+        load_users(filepath)
+        return None
+    return entry[3].get(email.lower())
 
 
 def calculate_deadline_days(deadline_str: str) -> int:
@@ -154,9 +477,15 @@ def calculate_deadline_days(deadline_str: str) -> int:
     Returns:
         Number of days until deadline
     """
+    return _days_until(deadline_str, datetime.utcnow())
+
+
+def _days_until(deadline_str: str, today: datetime) -> int:
+    """
+    calculate_deadline_days against a caller-supplied "now", so a batch can share one clock read
+    """
     try:
-        deadline = datetime.strptime(deadline_str, "%Y-%m-%d")
-        today = datetime.utcnow()
+        deadline = _parse_date(deadline_str)
         delta = deadline - today
         return max(0, delta.days)  # Return 0 if deadline has passed
     except Exception as e:
@@ -167,6 +496,7 @@ def calculate_deadline_days(deadline_str: str) -> int:
 def update_scholarship_deadlines(scholarships: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Update deadline_days field for all scholarships based on current date
+    All deadlines are converted in one vectorized pass, against a single "now"
     
     Args:
         scholarships: List of scholarship dictionaries
@@ -174,12 +504,82 @@ def update_scholarship_deadlines(scholarships: List[Dict[str, Any]]) -> List[Dic
     Returns:
         Updated list of scholarships
     """
-    for scholarship in scholarships:
-        if 'deadline' in scholarship:
-            scholarship['deadline_days'] = calculate_deadline_days(scholarship['deadline'])
+    today = datetime.utcnow()  # one clock read for the whole batch
+    dated = [s for s in scholarships if 'deadline' in s]
+    if dated:
+        days = _deadline_days_array([s['deadline'] for s in dated], today)
+        for scholarship, deadline_days in zip(dated, days.tolist()):
+            scholarship['deadline_days'] = deadline_days
+    _clear_scholarship_caches()
     return scholarships
 
 
+# Search index for the most recently searched list: (scholarships, index)
+# Holding the list itself keeps its identity stable while it is cached
+_search_index_cache: tuple = (None, None)
+
+
+def build_search_index(scholarships: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build parallel per-field arrays used by search_scholarships
+    
+    Args:
+        scholarships: List of scholarship dictionaries
+    
+    Returns:
+        Dictionary with lowercased names_lc/descs_lc/cats_lc lists (plus UTF-8
+        encoded names_b/descs_b/cats_b copies), the raw categories, a float
+        amounts array (NaN where amount is not a number) and a by_name dict of
+        lowercased name -> first scholarship with that name
+    """
+    import numpy as np
+    
+    names_lc = [s.get('name', '').lower() for s in scholarships]
+    descs_lc = [s.get('description', '').lower() for s in scholarships]
+    cats_lc = [s.get('category', '').lower() for s in scholarships]
+    
+    by_name = {}
+    for name_lc, s in zip(names_lc, scholarships):
+        by_name.setdefault(name_lc, s)
+    
+    return {
+        "size": len(scholarships),
+        "names_lc": names_lc,
+        "by_name": by_name,
+        "descs_lc": descs_lc,
+        "cats_lc": cats_lc,
+        "names_b": [text.encode('utf-8', 'surrogatepass') for text in names_lc],
+        "descs_b": [text.encode('utf-8', 'surrogatepass') for text in descs_lc],
+        "cats_b": [text.encode('utf-8', 'surrogatepass') for text in cats_lc],
+        "categories": [s.get('category', '') for s in scholarships],
+        "amounts": np.array([
+            s['amount'] if isinstance(s.get('amount'), (int, float)) else np.nan
+            for s in scholarships
+        ], dtype=float),
+    }
+
+
+def _get_search_index(scholarships: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the cached search index for scholarships, rebuilding it for a new list
+    """
+    global _search_index_cache
+    cached_list, index = _search_index_cache
+    if cached_list is not scholarships or index["size"] != len(scholarships):
+        index = build_search_index(scholarships)
+        _search_index_cache = (scholarships, index)
+    return index
+
+
+def _clear_scholarship_caches() -> None:
+    """
+    Drop the cached search index and categories after scholarships change
+    """
+    global _search_index_cache, _categories_cache
+    _search_index_cache = (None, None)
+    _categories_cache = (None, 0, ())
+
+
 def search_scholarships(scholarships: List[Dict[str, Any]], 
                        query: str = "",
                        category: str = None,
@@ -198,36 +598,44 @@ def search_scholarships(scholarships: List[Dict[str, Any]],
     Returns:
         Filtered list of scholarships
     """
-    results = scholarships.copy()
-    
-    # Filter by keyword
-    if query:
-        query_lower = query.lower()
-        results = [
-            s for s in results 
-            if query_lower in s.get('name', '').lower() 
-            or query_lower in s.get('description', '').lower()
-            or query_lower in s.get('category', '').lower()
-        ]
+    import numpy as np
     
-    # Filter by category
-    if category:
-        results = [s for s in results if s.get('category', '') == category]
+    index = _get_search_index(scholarships)
     
-    # Filter by amount
+    # Filter by amount (NaN amounts fail both comparisons)
+    keep = np.ones(index["size"], dtype=bool)
     if min_amount is not None:
-        results = [
-            s for s in results 
-            if isinstance(s.get('amount'), (int, float)) and s.get('amount', 0) >= min_amount
-        ]
-    
+        keep &= index["amounts"] >= min_amount
     if max_amount is not None:
-        results = [
-            s for s in results 
-            if isinstance(s.get('amount'), (int, float)) and s.get('amount', 0) <= max_amount
-        ]
-    
-    return results
+        keep &= index["amounts"] <= max_amount
+    
+    query_lower = query.lower() if query else None
+    if query_lower is not None and query_lower.isascii():
+        # ASCII bytes never occur inside a multi-byte UTF-8 sequence, so a bytes
+        # search gives the same answer through the faster bytes.__contains__
+        query_lower = query_lower.encode('ascii')
+        names_lc, descs_lc, cats_lc = index["names_b"], index["descs_b"], index["cats_b"]
+    else:
+        names_lc, descs_lc, cats_lc = index["names_lc"], index["descs_lc"], index["cats_lc"]
+    categories = index["categories"]
+    
+    def ok(i: int) -> bool:
+        # Filter by category
+        if category and categories[i] != category:
+            return False
+        
+        # Filter by keyword
+        return query_lower is None or (
+            query_lower in names_lc[i]
+            or query_lower in descs_lc[i]
+            or query_lower in cats_lc[i]
+        )
+    
+    return [scholarships[i] for i in np.flatnonzero(keep).tolist() if ok(i)]
+
+
+# Sorted categories for the most recently seen list: (scholarships, size, categories)
+_categories_cache: tuple = (None, 0, ())
 
 
 def get_categories(scholarships: List[Dict[str, Any]]) -> List[str]:
@@ -240,11 +648,12 @@ def get_categories(scholarships: List[Dict[str, Any]]) -> List[str]:
     Returns:
         Sorted list of unique categories
     """
-    categories = set()
-    for scholarship in scholarships:
-        cat = scholarship.get('category', 'General')
-        categories.add(cat)
-    return sorted(list(categories))
+    global _categories_cache
+    cached_list, size, categories = _categories_cache
+    if cached_list is not scholarships or size != len(scholarships):
+        categories = tuple(sorted({s.get('category', 'General') for s in scholarships}))
+        _categories_cache = (scholarships, len(scholarships), categories)
+    return list(categories)
 
 
 def get_scholarship_by_name(name: str, scholarships: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -258,10 +667,7 @@ def get_scholarship_by_name(name: str, scholarships: List[Dict[str, Any]]) -> Di
     Returns:
         Scholarship dictionary or None if not found
     """
-    for scholarship in scholarships:
-        if scholarship.get('name', '').lower() == name.lower():
-            return scholarship
-    return None
+    return _get_search_index(scholarships)["by_name"].get(name.lower())
 
 
 def generate_sample_scholarships() -> List[Dict[str, Any]]:
@@ -335,13 +741,15 @@ def generate_sample_scholarships() -> List[Dict[str, Any]]:
     return sample_scholarships
 
 
-def export_matches_to_json(matches: List[Dict[str, Any]], filename: str = "my_matches.json") -> str:
+def export_matches_to_json(matches: List[Dict[str, Any]], filename: str = "my_matches.json",
+                          compact: bool = False) -> str:
     """
     Export matched scholarships to a JSON file for download
     
     Args:
-        matches: List of matched scholarship dictionaries
+        matches: List of match dictionaries from match_scholarships
         filename: Output filename
+        compact: Write without indentation (smaller, for machine consumption)
     
     Returns:
         Filepath of exported file
@@ -350,8 +758,12 @@ def export_matches_to_json(matches: List[Dict[str, Any]], filename: str = "my_ma
         output_path = f"exports/{filename}"
         os.makedirs("exports", exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(matches, f, indent=2, ensure_ascii=False)
+        # Each exported entry is the scholarship with its match fields alongside
+        flat = [
+            {**m['scholarship'], **{k: v for k, v in m.items() if k != 'scholarship'}}
+            for m in matches
+        ]
+        _write_atomic(output_path, _json_dumps(flat, compact=compact))
         
         print(f"✅ Exported {len(matches)} matches to {output_path}")
         return output_path
@@ -379,19 +791,28 @@ def get_statistics(scholarships: List[Dict[str, Any]]) -> Dict[str, Any]:
             "urgent_deadlines": 0
         }
     
-    # Calculate totals
-    amounts = [s.get('amount', 0) for s in scholarships if isinstance(s.get('amount'), (int, float))]
-    total_funding = sum(amounts)
-    avg_amount = int(total_funding / len(amounts)) if amounts else 0
-    
-    # Category breakdown
+    # Single pass: funding totals, category breakdown and urgent (< 30 days) deadlines
+    total_funding = 0
+    amount_count = 0
     categories = {}
+    urgent = 0
     for s in scholarships:
+        amount = s.get('amount')
+        if isinstance(amount, (int, float)):
+            total_funding += amount
+            amount_count += 1
+        
         cat = s.get('category', 'General')
         categories[cat] = categories.get(cat, 0) + 1
+        
+        if s.get('deadline_days', 999) < 30:
+            urgent += 1
     
-    # Count urgent deadlines (< 30 days)
-    urgent = len([s for s in scholarships if s.get('deadline_days', 999) < 30])
+    avg_amount = int(total_funding / amount_count) if amount_count else 0
+    
+    # get_categories can reuse the breakdown for this list
+    global _categories_cache
+    _categories_cache = (scholarships, len(scholarships), tuple(sorted(categories)))
     
     return {
         "total_scholarships": len(scholarships),
@@ -402,6 +823,11 @@ def get_statistics(scholarships: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# Fields every scholarship must have, in the order errors are reported
+REQUIRED_FIELDS = ('name', 'amount', 'deadline', 'category')
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+
+
 def validate_scholarship_data(scholarship: Dict[str, Any]) -> tuple:
     """
     Validate scholarship data structure
@@ -413,11 +839,12 @@ def validate_scholarship_data(scholarship: Dict[str, Any]) -> tuple:
         Tuple of (is_valid, error_messages)
     """
     errors = []
-    required_fields = ['name', 'amount', 'deadline', 'category']
     
-    for field in required_fields:
-        if field not in scholarship:
-            errors.append(f"Missing required field: {field}")
+    # Subset test on the keys view runs in C; only walk the fields when one is missing
+    if not _REQUIRED_FIELD_SET <= scholarship.keys():
+        for field in REQUIRED_FIELDS:
+            if field not in scholarship:
+                errors.append(f"Missing required field: {field}")
     
     # Validate amount
     if 'amount' in scholarship:
@@ -427,7 +854,7 @@ def validate_scholarship_data(scholarship: Dict[str, Any]) -> tuple:
     # Validate deadline format
     if 'deadline' in scholarship:
         try:
-            datetime.strptime(scholarship['deadline'], "%Y-%m-%d")
+            _parse_date(scholarship['deadline'])
         except ValueError:
             errors.append("Deadline must be in YYYY-MM-DD format")
     
@@ -439,6 +866,22 @@ def validate_scholarship_data(scholarship: Dict[str, Any]) -> tuple:
     return (len(errors) == 0, errors)
 
 
+def validate_scholarships_batch(scholarships: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Validate many scholarships lazily
+    
+    Args:
+        scholarships: Iterable of scholarship dictionaries (a list or a stream being loaded)
+    
+    Yields:
+        (index, error_messages) for each scholarship that fails validation
+    """
+    for idx, scholarship in enumerate(scholarships):
+        is_valid, errors = validate_scholarship_data(scholarship)
+        if not is_valid:
+            yield idx, errors
+
+
 # Test functions
 if __name__ == "__main__":
     print("🧪 Testing database.py functions...\n")
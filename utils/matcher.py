@@ -3,12 +3,599 @@ ScholarMatch - Scholarship Matching Algorithm
 Matches user profiles to scholarships using weighted scoring system with Hard Filters
 """
 
-import pandas as pd
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, NamedTuple, Optional
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the NumPy scorer is used without it
+    njit = None
+    prange = range
 
-def calculate_match_score(user_profile: Dict[str, Any], scholarship: Dict[str, Any]) -> Tuple[int, List[str]]:
+
+logger = logging.getLogger(__name__)
+
+# List-valued scholarship fields that are matched by membership, stored as packed uint64 bitmasks
+SET_FIELDS = ('grade_levels', 'states', 'majors', 'demographics', 'interests', 'special_circumstances')
+
+# Number of set bits in every byte value, used when np.bitwise_count is unavailable
+_POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Sum of all weighted sections in calculate_match_score
+MAX_SCORE = 100
+
+# Shared token -> bit position table for the per-row scorer's integer bitmasks,
+# with BIT_TO_TOKEN as the reverse lookup. Only scholarship tokens are registered
+# (when a scholarship is prepared); user values are looked up with _known_bit, so
+# free-form profile input can never grow the table.
+# The bit position doubles as the integer ID of single-valued fields (grade level,
+# state, major, gender), so no string is compared while scoring.
+TOKEN_TO_BIT: Dict[str, int] = {}
+BIT_TO_TOKEN: List[str] = []
+_token_lock = threading.Lock()
+
+
+def _token_bit(token: str) -> int:
+    """
+    Bit position of a token, registering it if it has not been seen yet
+    """
+    bit = TOKEN_TO_BIT.get(token)
+    if bit is None:
+        with _token_lock:
+            bit = TOKEN_TO_BIT.get(token)
+            if bit is None:
+                bit = len(BIT_TO_TOKEN)
+                BIT_TO_TOKEN.append(token)
+                TOKEN_TO_BIT[token] = bit
+    return bit
+
+
+def _token_mask(values: List[str]) -> int:
+    """
+    Integer bitmask with one bit set per value
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << _token_bit(value)
+    return mask
+
+
+def _known_bit(token: str) -> int:
+    """
+    One-bit mask of an already registered token, or 0 if no scholarship uses it
+    """
+    bit = TOKEN_TO_BIT.get(token)
+    return 1 << bit if bit is not None else 0
+
+
+def _known_mask(values: List[str]) -> int:
+    """
+    Integer bitmask of the registered values, ignoring tokens no scholarship uses
+    """
+    mask = 0
+    for value in values:
+        mask |= _known_bit(value)
+    return mask
+
+
+def _mask_tokens(mask: int) -> List[str]:
+    """
+    Tokens whose bits are set in a mask, in bit order
+    """
+    tokens = []
+    while mask:
+        low = mask & -mask
+        tokens.append(BIT_TO_TOKEN[low.bit_length() - 1])
+        mask ^= low
+    return tokens
+
+
+if hasattr(int, 'bit_count'):
+    _bit_count = int.bit_count
+else:  # Python 3.9
+    def _bit_count(mask: int) -> int:
+        return bin(mask).count('1')
+
+
+# 'All' states and 'Any' majors open a scholarship to everyone
+ALL_STATES_BIT = 1 << _token_bit('All')
+ANY_MAJOR_BIT = 1 << _token_bit('Any')
+
+
+# __slots__ on dataclasses needs Python 3.10+; older versions get regular instances
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class UserProfile:
+    """
+    Typed view of a user profile dictionary, with TOKEN_TO_BIT bits for the matched fields
+    
+    The single-valued fields are encoded as one-bit masks (grade_bit, state_bit,
+    major_bit, gender_bit) that test against a scholarship's masks with a single &;
+    the string values are kept only for reason text. gender_bit is 0 for
+    'Prefer not to say', so it never counts as a demographic match. Values no
+    scholarship uses get no bit; token_count is len(BIT_TO_TOKEN) when the bits were
+    computed, so a profile that predates newer scholarship tokens can be rebuilt.
+    """
+    gpa: float
+    grade_level: str
+    state: str
+    major: str
+    gender: str
+    ethnicity: List[str]
+    interests: List[str]
+    special_circumstances: List[str]
+    grade_bit: int
+    state_bit: int
+    major_bit: int
+    gender_bit: int
+    ethnicity_mask: int
+    interests_mask: int
+    special_mask: int
+    token_count: int
+
+
+# The UserProfile fields _preprocess_user reads from a profile dictionary
+_USER_FIELDS = ('gpa', 'grade_level', 'state', 'major', 'gender',
+                'ethnicity', 'interests', 'special_circumstances')
+
+
+@dataclass(**_SLOTS)
+class Scholarship:
+    """
+    Typed view of a scholarship dictionary used by the per-row scorer
+    
+    The list fields are stored as TOKEN_TO_BIT bitmasks; the dictionary keeps
+    the original lists, which reason strings need for their order.
+    """
+    name: str
+    category: str
+    amount: Any
+    deadline_days: int
+    min_gpa: float
+    grade_mask: int
+    state_mask: int
+    major_mask: int
+    demographics_mask: int
+    interests_mask: int
+    special_mask: int
+
+
+class ScholarshipArrays(NamedTuple):
+    """
+    Struct-of-Arrays view of the scholarship list used by the vectorized matcher
+    
+    Numeric fields are stored as parallel NumPy columns. List-valued fields in
+    SET_FIELDS are packed into (rows x words) uint64 bitmasks, one bit per token.
+    prepared holds each record as a Scholarship for calculate_match_score.
+    """
+    records: List[Dict[str, Any]]
+    prepared: List[Scholarship]
+    min_gpa: np.ndarray
+    neg_amount: np.ndarray
+    deadline_days: np.ndarray
+    vocab: Dict[str, Dict[str, int]]
+    masks: Dict[str, np.ndarray]
+
+
+def build_scholarship_arrays(scholarships: List[Dict[str, Any]]) -> ScholarshipArrays:
+    """
+    Convert a list of scholarship dictionaries into a ScholarshipArrays bundle
+    
+    Args:
+        scholarships: List of scholarship dictionaries
+    
+    Returns:
+        ScholarshipArrays with one entry per scholarship (neg_amount is the negated
+        amount used as a descending sort key, 0 when the amount is not numeric)
+    """
+    vocab = {}
+    masks = {}
+    
+    for field in SET_FIELDS:
+        tokens = {}
+        for scholarship in scholarships:
+            for token in scholarship.get(field, []):
+                tokens.setdefault(token, len(tokens))
+        vocab[field] = tokens
+        
+        matrix = np.zeros((len(scholarships), _mask_words(tokens)), dtype=np.uint64)
+        for row, scholarship in enumerate(scholarships):
+            matrix[row] = _pack_mask(tokens, scholarship.get(field, []))
+        masks[field] = matrix
+    
+    return ScholarshipArrays(
+        records=scholarships,
+        prepared=[_prepare_scholarship(s) for s in scholarships],
+        min_gpa=np.array([s.get('min_gpa', 0.0) for s in scholarships], dtype=np.float64),
+        neg_amount=np.array([-s['amount'] if isinstance(s.get('amount'), (int, float)) else 0.0
+                             for s in scholarships], dtype=np.float64),
+        deadline_days=np.array([s.get('deadline_days', 999) for s in scholarships], dtype=np.int64),
+        vocab=vocab,
+        masks=masks
+    )
+
+
+def _prepare_scholarship(scholarship: Dict[str, Any]) -> Scholarship:
+    """
+    Build the Scholarship view of a scholarship dictionary (bitmasks for the list fields)
+    
+    The dictionary itself is left untouched: reason strings still need the
+    original list order.
+    """
+    get = scholarship.get
+    return Scholarship(
+        name=get('name', ''),
+        category=get('category', 'General'),
+        amount=get('amount'),
+        deadline_days=get('deadline_days', 999),
+        min_gpa=get('min_gpa', 0.0),
+        grade_mask=_token_mask(get('grade_levels', [])),
+        state_mask=_token_mask(get('states', [])),
+        major_mask=_token_mask(get('majors', [])),
+        demographics_mask=_token_mask(get('demographics', [])),
+        interests_mask=_token_mask(get('interests', [])),
+        special_mask=_token_mask(get('special_circumstances', []))
+    )
+
+
+def _mask_words(tokens: Dict[str, int]) -> int:
+    """
+    Number of uint64 words needed to hold one bit per token (at least one)
+    """
+    return max(1, (len(tokens) + 63) // 64)
+
+
+def _pack_mask(tokens: Dict[str, int], values: List[str]) -> np.ndarray:
+    """
+    Pack the known values into a uint64 bitmask using the token bit positions
+    """
+    mask = np.zeros(_mask_words(tokens), dtype=np.uint64)
+    for value in values:
+        if value in tokens:
+            bit = tokens[value]
+            mask[bit // 64] |= np.uint64(1 << (bit % 64))
+    return mask
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Count set bits in every uint64 element
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    return _POPCOUNT_LUT[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1)
+
+
+def _count_shared(masks: np.ndarray, user_mask: np.ndarray) -> np.ndarray:
+    """
+    Count how many bits of the user's mask are set in each scholarship's bitmask
+    """
+    return _popcount(masks & user_mask).sum(axis=1, dtype=np.int64)
+
+
+def _score_all_numpy(min_gpa, user_gpa, grade_masks, user_grade, state_masks, user_state,
+                     major_masks, user_major, demographic_masks, user_ethnicity, user_gender,
+                     interest_masks, user_interests, special_masks, user_special):
+    """
+    Apply the hard filters and weighted sections to the scholarship bitmasks
+    
+    Every user_* mask is packed with the same field vocabulary as the matching
+    scholarship masks; a scholarship with no bits set in a field has no
+    requirement for it.
+    """
+    grade_ok = ~grade_masks.any(axis=1) | (_count_shared(grade_masks, user_grade) > 0)
+    state_ok = ~state_masks.any(axis=1) | (_count_shared(state_masks, user_state) > 0)
+    major_ok = ~major_masks.any(axis=1) | (_count_shared(major_masks, user_major) > 0)
+    
+    demographics_empty = ~demographic_masks.any(axis=1)
+    ethnicity_hit = _count_shared(demographic_masks, user_ethnicity) > 0
+    gender_hit = _count_shared(demographic_masks, user_gender) > 0
+    
+    interests_empty = ~interest_masks.any(axis=1)
+    interest_hits = _count_shared(interest_masks, user_interests)
+    
+    special_empty = ~special_masks.any(axis=1)
+    special_hits = _count_shared(special_masks, user_special)
+    
+    # ==================== HARD FILTERS ====================
+    passed = ~((min_gpa > 0) & (user_gpa < min_gpa)) & grade_ok & state_ok
+    
+    # ==================== WEIGHTED SCORING ====================
+    # GPA (20), grade level (20) and location (10) are always earned once the hard filters pass
+    score = np.full(len(min_gpa), 20 + 20 + 10, dtype=np.int64)
+    score += np.where(major_ok, 25, 0)
+    score += np.where(demographics_empty, 5, 5 * ethnicity_hit + 5 * gender_hit)
+    score += np.where(interests_empty, 5, np.minimum(10, interest_hits * 3))
+    score += np.where(special_empty, 2, np.where(special_hits > 0, 5, 0))
+    
+    match_percentage = (score / MAX_SCORE * 100).astype(np.int64)
+    
+    return passed, match_percentage
+
+
+def _row_empty(masks, row):
+    """
+    True if one row of a bitmask matrix has no bits set
+    """
+    for word in range(masks.shape[1]):
+        if masks[row, word]:
+            return False
+    return True
+
+
+def _row_shared(masks, row, user_mask):
+    """
+    Number of bits one row of a bitmask matrix shares with the user's mask
+    """
+    count = 0
+    for word in range(masks.shape[1]):
+        bits = masks[row, word] & user_mask[word]
+        while bits:
+            bits &= bits - np.uint64(1)
+            count += 1
+    return count
+
+
+def _score_all_loop(min_gpa, user_gpa, grade_masks, user_grade, state_masks, user_state,
+                    major_masks, user_major, demographic_masks, user_ethnicity, user_gender,
+                    interest_masks, user_interests, special_masks, user_special):
+    """
+    Row-by-row version of _score_all_numpy, written to be compiled by numba
+    
+    Rows are independent, so the loop runs with prange across all cores.
+    """
+    n = min_gpa.shape[0]
+    passed = np.empty(n, dtype=np.bool_)
+    match_percentage = np.empty(n, dtype=np.int64)
+    
+    for i in prange(n):
+        grade_ok = _row_empty(grade_masks, i) or _row_shared(grade_masks, i, user_grade) > 0
+        state_ok = _row_empty(state_masks, i) or _row_shared(state_masks, i, user_state) > 0
+        passed[i] = not (min_gpa[i] > 0 and user_gpa < min_gpa[i]) and grade_ok and state_ok
+        
+        score = 20 + 20 + 10
+        if _row_empty(major_masks, i) or _row_shared(major_masks, i, user_major) > 0:
+            score += 25
+        if _row_empty(demographic_masks, i):
+            score += 5
+        else:
+            if _row_shared(demographic_masks, i, user_ethnicity) > 0:
+                score += 5
+            if _row_shared(demographic_masks, i, user_gender) > 0:
+                score += 5
+        if _row_empty(interest_masks, i):
+            score += 5
+        else:
+            score += min(10, _row_shared(interest_masks, i, user_interests) * 3)
+        if _row_empty(special_masks, i):
+            score += 2
+        elif _row_shared(special_masks, i, user_special) > 0:
+            score += 5
+        
+        match_percentage[i] = int(score / MAX_SCORE * 100)
+    
+    return passed, match_percentage
+
+
+# fastmath is left off on purpose: it may fold score / MAX_SCORE * 100 and change the truncation
+if njit is not None:
+    _row_empty = njit(cache=True)(_row_empty)
+    _row_shared = njit(cache=True)(_row_shared)
+    _score_kernel = njit(cache=True, parallel=True)(_score_all_loop)
+    # Single-threaded variant for score_scholarships(n_jobs > 1): it releases the GIL so
+    # several chunks run side by side, which the parallel kernel must not be used for
+    _score_chunk_kernel = njit(cache=True, nogil=True)(_score_all_loop)
+else:
+    _score_kernel = None
+    _score_chunk_kernel = None
+_score_all = _score_all_numpy
+_score_chunk = _score_all_numpy
+
+
+def activate_numba_scorer(parallel: bool = True) -> bool:
+    """
+    Switch score_scholarships to the numba-compiled kernel
+    
+    The kernel is compiled right away with a one-row dummy input so the first
+    real match does not pay for JIT compilation.
+    
+    Args:
+        parallel: Use the prange kernel across all cores. Pass False in servers that
+            score from many threads (e.g. Streamlit sessions): numba's threading layer
+            is not meant to be launched from concurrent threads, so every call then
+            uses the single-threaded nogil kernel
+    
+    Returns:
+        True if the numba kernel is active, False if numba is not installed
+    """
+    global _score_all, _score_chunk
+    
+    if _score_kernel is None:
+        logger.warning("⚠️ numba is not installed, keeping the NumPy scorer")
+        return False
+    
+    kernel = _score_kernel if parallel else _score_chunk_kernel
+    if _score_all is kernel:
+        return True
+    
+    masks = np.zeros((1, 1), dtype=np.uint64)
+    user_mask = np.zeros(1, dtype=np.uint64)
+    for compiled in {kernel, _score_chunk_kernel}:
+        compiled(np.zeros(1), 0.0, masks, user_mask, masks, user_mask, masks, user_mask,
+                 masks, user_mask, user_mask, masks, user_mask, masks, user_mask)
+    _score_all = kernel
+    _score_chunk = _score_chunk_kernel
+    return True
+
+
+def score_scholarships(user_profile, arrays: ScholarshipArrays, n_jobs: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized equivalent of calculate_match_score over every scholarship at once
+    
+    Args:
+        user_profile: User profile dictionary or UserProfile
+        arrays: ScholarshipArrays built from the scholarship list
+        n_jobs: Number of threads scoring contiguous chunks of scholarships (default: 1).
+                Worth raising only for very large scholarship lists
+    
+    Returns:
+        Tuple of (passed_hard_filters mask, match_percentage array)
+    """
+    user = user_profile if isinstance(user_profile, UserProfile) else _preprocess_user(user_profile)
+    vocab = arrays.vocab
+    masks = arrays.masks
+    genders = [user.gender] if user.gender != 'Prefer not to say' else []
+    
+    user_grade = _pack_mask(vocab['grade_levels'], [user.grade_level])
+    user_state = _pack_mask(vocab['states'], ['All', user.state])
+    user_major = _pack_mask(vocab['majors'], ['Any', user.major])
+    user_ethnicity = _pack_mask(vocab['demographics'], user.ethnicity)
+    user_gender = _pack_mask(vocab['demographics'], genders)
+    user_interests = _pack_mask(vocab['interests'], user.interests)
+    user_special = _pack_mask(vocab['special_circumstances'], user.special_circumstances)
+    
+    def score_rows(scorer, rows):
+        return scorer(
+            arrays.min_gpa[rows],
+            float(user.gpa),
+            masks['grade_levels'][rows], user_grade,
+            masks['states'][rows], user_state,
+            masks['majors'][rows], user_major,
+            masks['demographics'][rows], user_ethnicity, user_gender,
+            masks['interests'][rows], user_interests,
+            masks['special_circumstances'][rows], user_special
+        )
+    
+    n = len(arrays.records)
+    if n_jobs <= 1 or n < 2 * n_jobs:
+        return score_rows(_score_all, slice(None))
+    
+    # Rows are independent, so each thread scores one contiguous slice (views, no copies)
+    bounds = np.linspace(0, n, n_jobs + 1, dtype=np.int64)
+    chunks = [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        parts = list(pool.map(lambda rows: score_rows(_score_chunk, rows), chunks))
+    
+    return (np.concatenate([passed for passed, _ in parts]),
+            np.concatenate([scores for _, scores in parts]))
+
+
+def _preprocess_user(user_profile: Dict[str, Any]) -> UserProfile:
+    """
+    Read the user fields used for matching once, adding their bitmasks
+    
+    Args:
+        user_profile: Dictionary containing user information
+    
+    Returns:
+        UserProfile that can be passed to calculate_match_score and score_scholarships
+    """
+    get = user_profile.get
+    ethnicity = get('ethnicity', [])
+    interests = get('interests', [])
+    circumstances = get('special_circumstances', [])
+    grade_level = get('grade_level', '')
+    state = get('state', '')
+    major = get('major', '')
+    gender = get('gender', '')
+    # Read before the lookups, so a token registered meanwhile makes the profile stale, not wrong
+    token_count = len(BIT_TO_TOKEN)
+    
+    return UserProfile(
+        gpa=get('gpa', 0.0),
+        grade_level=grade_level,
+        state=state,
+        major=major,
+        gender=gender,
+        ethnicity=ethnicity,
+        interests=interests,
+        special_circumstances=circumstances,
+        grade_bit=_known_bit(grade_level),
+        state_bit=_known_bit(state),
+        major_bit=_known_bit(major),
+        gender_bit=_known_bit(gender) if gender != 'Prefer not to say' else 0,
+        ethnicity_mask=_known_mask(ethnicity),
+        interests_mask=_known_mask(interests),
+        special_mask=_known_mask(circumstances),
+        token_count=token_count
+    )
+
+
+def _current_user(user_profile) -> UserProfile:
+    """
+    UserProfile whose bits cover every registered token
+    A UserProfile built before newer scholarship tokens were registered is rebuilt from its values
+    """
+    if not isinstance(user_profile, UserProfile):
+        return _preprocess_user(user_profile)
+    if user_profile.token_count == len(BIT_TO_TOKEN):
+        return user_profile
+    return _preprocess_user({field: getattr(user_profile, field) for field in _USER_FIELDS})
+
+
+class _R:
+    """
+    Reason strings that never change, shared by every match instead of rebuilt per call
+    """
+    NO_GPA = "✓ No GPA requirement"
+    OPEN_MAJORS = "✓ Open to all majors"
+    GRADE_OK = "✓ Grade level eligible"
+    NATIONWIDE = "✓ Available nationwide"
+    NO_DEMOGRAPHICS = "✓ No demographic restrictions"
+    NO_INTERESTS = "✓ No interest requirements"
+
+
+# Reason code tag -> formatter; a reason code is a (tag, payload) tuple and
+# format_reasons calls the formatter with *payload
+_REASON_FORMATS = {
+    'gpa_fail': lambda need, have: f"❌ HARD FAIL: GPA requirement not met (need {need}, have {have})",
+    'grade_fail': lambda need, have: f"❌ HARD FAIL: Grade level not eligible (need: {', '.join(need)}, have: {have})",
+    'state_fail': lambda need, have: f"❌ HARD FAIL: Location not eligible (need: {', '.join(need)}, have: {have})",
+    'gpa_met': lambda min_gpa: f"✓ Meets GPA requirement ({min_gpa})",
+    'no_gpa': lambda: _R.NO_GPA,
+    'major_match': lambda major: f"✓ Perfect major match: {major}",
+    'open_majors': lambda: _R.OPEN_MAJORS,
+    'major_pref': lambda majors, have: f"○ Major preference: {', '.join(majors)} (you have: {have})",
+    'grade_ok': lambda: _R.GRADE_OK,
+    'state_match': lambda state: f"✓ State match: {state}",
+    'nationwide': lambda: _R.NATIONWIDE,
+    'no_demographics': lambda: _R.NO_DEMOGRAPHICS,
+    'ethnicity_match': lambda ethnicities, mask: (
+        f"✓ Demographics match: {', '.join(eth for eth in ethnicities if mask & _known_bit(eth))}"),
+    'gender_match': lambda gender: f"✓ Gender match: {gender}",
+    'demographic_pref': lambda demographics: f"○ Demographic preference: {', '.join(demographics[:2])}",
+    'interests_match': lambda mask: f"✓ Interests: {', '.join(_mask_tokens(mask)[:3])}",
+    'interests_pref': lambda interests: f"○ Preferred interests: {', '.join(interests[:2])}",
+    'no_interests': lambda: _R.NO_INTERESTS,
+    'special_match': lambda mask: f"✓ Special: {', '.join(_mask_tokens(mask))}",
+    'special_pref': lambda circumstances: f"○ Preference for: {', '.join(circumstances)}",
+}
+
+
+def format_reasons(reason_codes: List[Tuple[str, tuple]]) -> List[str]:
+    """
+    Turn reason codes from _score_reason_codes into display strings
+    
+    Args:
+        reason_codes: List of (tag, payload) tuples
+    
+    Returns:
+        List of match reason strings
+    """
+    return [_REASON_FORMATS[tag](*payload) for tag, payload in reason_codes]
+
+
+def calculate_match_score(user_profile, scholarship: Dict[str, Any],
+                          prepared: Optional[Scholarship] = None,
+                          min_match_threshold: int = 0) -> Tuple[int, List[str]]:
     """
     Calculate match score between user profile and scholarship with Hard Filters
     
@@ -18,39 +605,86 @@ def calculate_match_score(user_profile: Dict[str, Any], scholarship: Dict[str, A
     3. State/Location - Must match if not 'All'
     
     Args:
-        user_profile: Dictionary containing user information
+        user_profile: User profile dictionary or UserProfile
         scholarship: Dictionary containing scholarship information
+        prepared: The scholarship's Scholarship view (built here if omitted)
+        min_match_threshold: Stop scoring and return (0, []) as soon as the
+            scholarship can no longer reach this match percentage (default: never)
     
     Returns:
         Tuple of (match_score, match_reasons)
     """
+    match_percentage, reason_codes = _score_reason_codes(user_profile, scholarship, prepared, min_match_threshold)
+    return match_percentage, format_reasons(reason_codes)
+
+
+def _check_hard_filters(user: UserProfile, scholarship: Dict[str, Any],
+                        s: Scholarship) -> Optional[Tuple[str, tuple]]:
+    """
+    Run only the three hard filters for one scholarship
     
-    # ==================== HARD FILTERS ====================
-    # These must ALL pass or scholarship gets 0% match immediately
+    Args:
+        user: UserProfile from _preprocess_user
+        scholarship: Dictionary containing scholarship information
+        s: The scholarship's Scholarship view
     
+    Returns:
+        Reason code of the first failing filter, or None if all of them pass
+    """
     # HARD FILTER 1: GPA Check
-    min_gpa = scholarship.get('min_gpa', 0.0)
-    user_gpa = user_profile.get('gpa', 0.0)
-    
-    if min_gpa > 0 and user_gpa < min_gpa:
-        return (0, [f"❌ HARD FAIL: GPA requirement not met (need {min_gpa}, have {user_gpa})"])
+    if s.min_gpa > 0 and user.gpa < s.min_gpa:
+        return ('gpa_fail', (s.min_gpa, user.gpa))
     
     # HARD FILTER 2: Grade Level Check
-    required_grades = scholarship.get('grade_levels', [])
-    user_grade = user_profile.get('grade_level', '')
-    
-    if required_grades and user_grade not in required_grades:
-        return (0, [f"❌ HARD FAIL: Grade level not eligible (need: {', '.join(required_grades)}, have: {user_grade})"])
+    if s.grade_mask and not s.grade_mask & user.grade_bit:
+        return ('grade_fail', (scholarship['grade_levels'], user.grade_level))
     
     # HARD FILTER 3: State/Location Check (only if not 'All')
-    required_states = scholarship.get('states', [])
-    user_state = user_profile.get('state', '')
+    if s.state_mask and not s.state_mask & (ALL_STATES_BIT | user.state_bit):
+        return ('state_fail', (scholarship['states'], user.state))
+    
+    return None
+
+
+def _hard_filter_mask(user: UserProfile, arrays: ScholarshipArrays) -> np.ndarray:
+    """
+    Vectorized _check_hard_filters: True for every scholarship that passes all three filters
+    """
+    masks = arrays.masks
+    grade_masks = masks['grade_levels']
+    state_masks = masks['states']
     
-    if required_states and 'All' not in required_states and user_state not in required_states:
-        return (0, [f"❌ HARD FAIL: Location not eligible (need: {', '.join(required_states)}, have: {user_state})"])
+    grade_ok = ~grade_masks.any(axis=1) | (
+        _count_shared(grade_masks, _pack_mask(arrays.vocab['grade_levels'], [user.grade_level])) > 0)
+    state_ok = ~state_masks.any(axis=1) | (
+        _count_shared(state_masks, _pack_mask(arrays.vocab['states'], ['All', user.state])) > 0)
+    
+    return ~((arrays.min_gpa > 0) & (float(user.gpa) < arrays.min_gpa)) & grade_ok & state_ok
+
+
+def _score_reason_codes(user_profile, scholarship: Dict[str, Any],
+                        prepared: Optional[Scholarship] = None,
+                        min_match_threshold: int = 0) -> Tuple[int, List[Tuple[str, tuple]]]:
+    """
+    calculate_match_score, but with reasons left as compact (tag, payload) codes
+    Arguments are the same as for calculate_match_score
+    
+    Returns:
+        Tuple of (match_score, reason_codes); see format_reasons
+    """
+    # Prepare the scholarship first so its tokens are registered before the user is looked up
+    s = prepared if prepared is not None else _prepare_scholarship(scholarship)
+    user = _current_user(user_profile)
+    
+    # ==================== HARD FILTERS ====================
+    # These must ALL pass or scholarship gets 0% match immediately
+    failure = _check_hard_filters(user, scholarship, s)
+    if failure is not None:
+        return (0, [failure])
     
     # ==================== PASSED HARD FILTERS ====================
-    # Now proceed with weighted scoring
+    # Now proceed with weighted scoring. GPA, grade level and location were
+    # settled by the hard filters, so their points are always earned here.
     
     score = 0
     max_score = 0
@@ -58,100 +692,101 @@ def calculate_match_score(user_profile: Dict[str, Any], scholarship: Dict[str, A
     
     # 1. GPA Match (Weight: 20 points)
     max_score += 20
-    if user_gpa >= min_gpa:
-        score += 20
-        if min_gpa > 0:
-            reasons.append(f"✓ Meets GPA requirement ({min_gpa})")
-        else:
-            reasons.append(f"✓ No GPA requirement")
+    score += 20
+    if s.min_gpa > 0:
+        reasons.append(('gpa_met', (s.min_gpa,)))
+    else:
+        reasons.append(('no_gpa', ()))
     
     # 2. Major Match (Weight: 25 points)
     max_score += 25
-    required_majors = scholarship.get('majors', [])
-    user_major = user_profile.get('major', '')
+    major_mask = s.major_mask
+    user_major = user.major
     
-    if not required_majors or 'Any' in required_majors or user_major in required_majors:
+    if not major_mask or major_mask & (ANY_MAJOR_BIT | user.major_bit):
         score += 25
-        if required_majors and user_major in required_majors:
-            reasons.append(f"✓ Perfect major match: {user_major}")
-        elif not required_majors or 'Any' in required_majors:
-            reasons.append("✓ Open to all majors")
+        if major_mask & user.major_bit:
+            reasons.append(('major_match', (user_major,)))
+        else:
+            reasons.append(('open_majors', ()))
     else:
-        reasons.append(f"○ Major preference: {', '.join(required_majors)} (you have: {user_major})")
+        reasons.append(('major_pref', (scholarship['majors'], user_major)))
+    
+    # Early exit: the percentage never exceeds score + points still available
+    # (grade 20, state 10, demographics 10, interests 10, special 5)
+    if score + 55 < min_match_threshold:
+        return (0, [])
     
     # 3. Grade Level Match (Weight: 20 points)
     max_score += 20
-    if not required_grades or user_grade in required_grades:
-        score += 20
-        reasons.append(f"✓ Grade level eligible")
+    score += 20
+    reasons.append(('grade_ok', ()))
     
     # 4. State/Location Match (Weight: 10 points)
     max_score += 10
-    if not required_states or 'All' in required_states or user_state in required_states:
-        score += 10
-        if required_states and user_state in required_states and 'All' not in required_states:
-            reasons.append(f"✓ State match: {user_state}")
-        else:
-            reasons.append(f"✓ Available nationwide")
+    score += 10
+    if s.state_mask & user.state_bit and not s.state_mask & ALL_STATES_BIT:
+        reasons.append(('state_match', (user.state,)))
+    else:
+        reasons.append(('nationwide', ()))
     
     # 5. Demographics Match (Weight: 10 points)
     max_score += 10
-    required_demographics = scholarship.get('demographics', [])
-    user_ethnicity = user_profile.get('ethnicity', [])
-    user_gender = user_profile.get('gender', '')
+    demographics_mask = s.demographics_mask
     
-    if not required_demographics:
+    if not demographics_mask:
         score += 5  # Open to all
-        reasons.append("✓ No demographic restrictions")
+        reasons.append(('no_demographics', ()))
     else:
         demographic_match = False
         
-        # Check ethnicity match
-        if any(eth in required_demographics for eth in user_ethnicity):
+        # Check ethnicity match: one & decides it; the matching names are only
+        # picked out of the user's list when the reason is formatted
+        matching_eth = demographics_mask & user.ethnicity_mask
+        if matching_eth:
             score += 5
             demographic_match = True
-            matching_eth = [eth for eth in user_ethnicity if eth in required_demographics]
-            reasons.append(f"✓ Demographics match: {', '.join(matching_eth)}")
+            reasons.append(('ethnicity_match', (user.ethnicity, matching_eth)))
         
-        # Check gender match
-        if user_gender in required_demographics and user_gender != 'Prefer not to say':
+        # Check gender match ('Prefer not to say' has no gender bit)
+        if demographics_mask & user.gender_bit:
             score += 5
             demographic_match = True
-            reasons.append(f"✓ Gender match: {user_gender}")
+            reasons.append(('gender_match', (user.gender,)))
         
-        if not demographic_match and required_demographics:
-            reasons.append(f"○ Demographic preference: {', '.join(required_demographics[:2])}")
+        if not demographic_match:
+            reasons.append(('demographic_pref', (scholarship['demographics'],)))
+    
+    if score + 15 < min_match_threshold:
+        return (0, [])
     
     # 6. Interests Match (Weight: 10 points)
     max_score += 10
-    required_interests = scholarship.get('interests', [])
-    user_interests = user_profile.get('interests', [])
-    
-    if required_interests:
-        matching_interests = set(user_interests) & set(required_interests)
+    if s.interests_mask:
+        matching_interests = user.interests_mask & s.interests_mask
         if matching_interests:
             # Award points based on number of matching interests
-            interest_score = min(10, len(matching_interests) * 3)
+            interest_score = min(10, _bit_count(matching_interests) * 3)
             score += interest_score
-            reasons.append(f"✓ Interests: {', '.join(list(matching_interests)[:3])}")
+            reasons.append(('interests_match', (matching_interests,)))
         else:
-            reasons.append(f"○ Preferred interests: {', '.join(required_interests[:2])}")
+            reasons.append(('interests_pref', (scholarship['interests'],)))
     else:
         score += 5  # No specific interests required
-        reasons.append("✓ No interest requirements")
+        reasons.append(('no_interests', ()))
+    
+    if score + 5 < min_match_threshold:
+        return (0, [])
     
     # 7. Special Circumstances Match (Weight: 5 points)
     max_score += 5
-    required_circumstances = scholarship.get('special_circumstances', [])
-    user_circumstances = user_profile.get('special_circumstances', [])
-    
-    if required_circumstances:
-        matching_circumstances = set(user_circumstances) & set(required_circumstances)
+    if s.special_mask:
+        matching_circumstances = user.special_mask & s.special_mask
         if matching_circumstances:
             score += 5
-            reasons.append(f"✓ Special: {', '.join(matching_circumstances)}")
+            reasons.append(('special_match', (matching_circumstances,)))
         else:
-            reasons.append(f"○ Preference for: {', '.join(required_circumstances)}")
+            reasons.append(('special_pref', (scholarship['special_circumstances'],)))
     else:
         score += 2  # No specific circumstances required
     
@@ -161,74 +796,106 @@ def calculate_match_score(user_profile: Dict[str, Any], scholarship: Dict[str, A
     return match_percentage, reasons
 
 
-def match_scholarships(user_profile: Dict[str, Any], scholarships: List[Dict[str, Any]], 
-                       min_match_threshold: int = 40) -> List[Dict[str, Any]]:
+def match_scholarships(user_profile: Dict[str, Any], scholarships, min_match_threshold: int = 40,
+                       top_k: Optional[int] = None, n_jobs: int = 1) -> List[Dict[str, Any]]:
     """
     Match scholarships to user profile and return sorted results
     
     Args:
         user_profile: User profile dictionary
-        scholarships: List of scholarship dictionaries
+        scholarships: List of scholarship dictionaries or a prebuilt ScholarshipArrays
         min_match_threshold: Minimum match percentage to include (default: 40%)
+        top_k: Only materialize the best top_k matches (default: all). The top_k rows are
+               picked with np.partition in O(N) and only they are sorted, so callers
+               that show a short list should pass it instead of slicing the result
+        n_jobs: Number of scoring threads, see score_scholarships (default: 1)
     
     Returns:
-        List of matched scholarships with scores, sorted by match percentage
+        List of match dictionaries sorted by match percentage, each with the original
+        'scholarship' dictionary (shared, not copied) plus 'match_score',
+        'match_reasons' and 'urgency'
     """
-    matches = []
-    hard_failures = []
+    if not isinstance(scholarships, ScholarshipArrays):
+        scholarships = build_scholarship_arrays(scholarships)
     
-    for scholarship in scholarships:
-        match_score, match_reasons = calculate_match_score(user_profile, scholarship)
-        
-        # Track hard failures separately for analytics
-        if match_score == 0 and any('HARD FAIL' in reason for reason in match_reasons):
-            hard_failures.append({
-                'name': scholarship['name'],
-                'reason': match_reasons[0]
-            })
-            continue
-        
-        # Only include scholarships above threshold
-        if match_score >= min_match_threshold:
-            scholarship_copy = scholarship.copy()
-            scholarship_copy['match_score'] = match_score
-            scholarship_copy['match_reasons'] = match_reasons
-            
-            # Add urgency level based on deadline
-            deadline_days = scholarship.get('deadline_days', 999)
-            if deadline_days < 7:
-                scholarship_copy['urgency'] = 'critical'
-            elif deadline_days < 30:
-                scholarship_copy['urgency'] = 'high'
-            elif deadline_days < 90:
-                scholarship_copy['urgency'] = 'medium'
-            else:
-                scholarship_copy['urgency'] = 'low'
-            
-            matches.append(scholarship_copy)
+    # User-side bitmasks are built once here rather than once per scholarship
+    user = _preprocess_user(user_profile)
+    
+    passed, scores = score_scholarships(user, scholarships, n_jobs)
+    matches = _collect_matches(user, scholarships, passed, scores, min_match_threshold, top_k)
+    
+    # Hard failure details are only collected when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_hard_failures(user, scholarships, np.flatnonzero(~passed))
+    
+    return matches
+
+
+def _collect_matches(user: UserProfile, arrays: ScholarshipArrays, passed: np.ndarray, scores: np.ndarray,
+                     min_match_threshold: int, top_k: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Rank the scored scholarships and build the match entries for the returned rows
+    """
+    selected = np.flatnonzero(passed & (scores >= min_match_threshold))
+    
+    # Narrow down to the top_k best scores in O(N) before sorting; every row tied
+    # with the k-th score is kept so the amount/deadline tie-breaks stay exact
+    if top_k is not None and 0 < top_k < len(selected):
+        kth = len(selected) - top_k
+        kth_score = np.partition(scores[selected], kth)[kth]
+        selected = selected[scores[selected] >= kth_score]
     
     # Sort by match score (descending), then by amount (descending), then by deadline (ascending)
-    matches.sort(key=lambda x: (
-        -x['match_score'],  # Higher match score first
-        -x.get('amount', 0) if isinstance(x.get('amount'), (int, float)) else 0,  # Higher amount first
-        x.get('deadline_days', 999)  # Closer deadline first
+    order = np.lexsort((
+        arrays.deadline_days[selected],
+        arrays.neg_amount[selected],
+        -scores[selected]
     ))
+    selected = selected[order][:top_k]
     
-    # Optional: Log hard failures for debugging
-    if hard_failures:
-        print(f"📊 Hard Filter Stats: {len(hard_failures)} scholarships excluded due to hard requirements")
-        for failure in hard_failures[:5]:  # Show first 5
-            print(f"   • {failure['name']}: {failure['reason']}")
+    # Urgency level based on deadline, for all returned rows at once
+    deadline_days = arrays.deadline_days[selected]
+    urgency = np.select(
+        [deadline_days < 7, deadline_days < 30, deadline_days < 90],
+        ['critical', 'high', 'medium'],
+        'low'
+    ).tolist()
+    
+    # Only the returned rows get a match entry; the scholarship itself is referenced, not copied
+    matches = []
+    for i, urgency_level in zip(selected, urgency):
+        scholarship = arrays.records[i]
+        # Reason strings are only formatted for the rows that are returned
+        _, reason_codes = _score_reason_codes(user, scholarship, arrays.prepared[i])
+        
+        matches.append({
+            'scholarship': scholarship,
+            'match_score': int(scores[i]),
+            'match_reasons': format_reasons(reason_codes),
+            'urgency': urgency_level
+        })
     
     return matches
 
 
+def _log_hard_failures(user: UserProfile, arrays: ScholarshipArrays, failed_rows: np.ndarray) -> None:
+    """
+    Debug-log how many scholarships failed the hard filters, with the reason for the first few
+    """
+    if len(failed_rows):
+        logger.debug("📊 Hard Filter Stats: %d scholarships excluded due to hard requirements", len(failed_rows))
+        for i in failed_rows[:5]:  # Show first 5
+            failure = arrays.records[i]
+            reason_code = _check_hard_filters(user, failure, arrays.prepared[i])
+            logger.debug("   • %s: %s", failure['name'], format_reasons([reason_code])[0])
+
+
 def get_scholarship_statistics(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate statistics from matched scholarships
     
     Args:
-        matches: List of matched scholarship dictionaries
+        matches: List of match dictionaries from match_scholarships
     
     Returns:
         Dictionary containing statistics
@@ -242,26 +909,36 @@ def get_scholarship_statistics(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
             'categories': {}
         }
     
-    # Calculate total potential value
-    amounts = [s.get('amount', 0) for s in matches if isinstance(s.get('amount'), (int, float))]
-    total_value = sum(amounts[:10])  # Top 10 scholarships
-    
-    # Calculate average match score
-    avg_score = sum([s.get('match_score', 0) for s in matches]) / len(matches)
-    
-    # Count urgent deadlines
-    urgent = len([s for s in matches if s.get('deadline_days', 999) < 30])
-    
-    # Category breakdown
+    # Single pass over the matches for every aggregate
+    total_value = 0
+    valued = 0
+    score_sum = 0
+    urgent = 0
     categories = {}
-    for s in matches:
-        cat = s.get('category', 'General')
+    
+    for m in matches:
+        scholarship = m['scholarship']
+        
+        # Total potential value of the top 10 scholarships with a numeric amount
+        amount = scholarship.get('amount')
+        if valued < 10 and isinstance(amount, (int, float)):
+            total_value += amount
+            valued += 1
+        
+        score_sum += m.get('match_score', 0)
+        
+        # Count urgent deadlines
+        if scholarship.get('deadline_days', 999) < 30:
+            urgent += 1
+        
+        # Category breakdown
+        cat = scholarship.get('category', 'General')
         categories[cat] = categories.get(cat, 0) + 1
     
     return {
         'total_matches': len(matches),
         'total_potential_value': total_value,
-        'average_match_score': int(avg_score),
+        'average_match_score': int(score_sum / len(matches)),
         'urgent_deadlines': urgent,
         'categories': categories
     }
@@ -276,70 +953,125 @@ def filter_scholarships(matches: List[Dict[str, Any]],
     Filter matched scholarships based on criteria
     
     Args:
-        matches: List of matched scholarships
+        matches: List of match dictionaries from match_scholarships
         category: Filter by category
         min_amount: Minimum scholarship amount
         max_amount: Maximum scholarship amount
         deadline_range: 'week', 'month', 'quarter', 'year'
     
     Returns:
-        Filtered list of scholarships
+        Filtered list of matches
     """
-    filtered = matches.copy()
-    
-    # Filter by category
-    if category:
-        filtered = [s for s in filtered if s.get('category', '') == category]
-    
-    # Filter by amount
-    if min_amount is not None:
-        filtered = [s for s in filtered if isinstance(s.get('amount'), (int, float)) and s.get('amount', 0) >= min_amount]
-    
-    if max_amount is not None:
-        filtered = [s for s in filtered if isinstance(s.get('amount'), (int, float)) and s.get('amount', 0) <= max_amount]
+    deadline_limits = {
+        'week': 7,
+        'month': 30,
+        'quarter': 90,
+        'year': 365
+    }
+    max_days = deadline_limits.get(deadline_range, 365) if deadline_range else None
     
-    # Filter by deadline
-    if deadline_range:
-        deadline_limits = {
-            'week': 7,
-            'month': 30,
-            'quarter': 90,
-            'year': 365
-        }
-        max_days = deadline_limits.get(deadline_range, 365)
-        filtered = [s for s in filtered if s.get('deadline_days', 999) <= max_days]
+    # All criteria are checked in one pass over the matches
+    filtered = []
+    for m in matches:
+        scholarship = m['scholarship']
+        
+        # Filter by category
+        if category and scholarship.get('category', '') != category:
+            continue
+        
+        # Filter by amount
+        amount = scholarship.get('amount')
+        numeric = isinstance(amount, (int, float))
+        if min_amount is not None and (not numeric or amount < min_amount):
+            continue
+        if max_amount is not None and (not numeric or amount > max_amount):
+            continue
+        
+        # Filter by deadline
+        if max_days is not None and scholarship.get('deadline_days', 999) > max_days:
+            continue
+        
+        filtered.append(m)
     
     return filtered
 
 
-def get_hard_filter_failures(user_profile: Dict[str, Any], scholarships: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_hard_filter_failures(user_profile: Dict[str, Any], scholarships) -> List[Dict[str, Any]]:
     """
     Get list of scholarships that failed hard filters with reasons
     Useful for analytics and understanding why students don't match certain scholarships
     
     Args:
         user_profile: User profile dictionary
-        scholarships: List of scholarship dictionaries
+        scholarships: List of scholarship dictionaries or a prebuilt ScholarshipArrays
     
     Returns:
         List of dictionaries with scholarship name and failure reason
     """
-    failures = []
+    if not isinstance(scholarships, ScholarshipArrays):
+        scholarships = build_scholarship_arrays(scholarships)
     
-    for scholarship in scholarships:
-        match_score, match_reasons = calculate_match_score(user_profile, scholarship)
-        
-        if match_score == 0 and any('HARD FAIL' in reason for reason in match_reasons):
-            failures.append({
-                'scholarship': scholarship['name'],
-                'amount': scholarship.get('amount', 'Varies'),
-                'category': scholarship.get('category', 'General'),
-                'failure_reason': match_reasons[0]
-            })
+    # Only the hard filters run (vectorized), no weighted scoring
+    user = _preprocess_user(user_profile)
+    passed = _hard_filter_mask(user, scholarships)
+    
+    return _collect_failures(user, scholarships, np.flatnonzero(~passed))
+
+
+def _collect_failures(user: UserProfile, arrays: ScholarshipArrays, failed_rows: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Build the get_hard_filter_failures entries, re-checking each failing row for its reason text
+    """
+    failures = []
+    for i in failed_rows:
+        scholarship = arrays.records[i]
+        reason_code = _check_hard_filters(user, scholarship, arrays.prepared[i])
+        failures.append({
+            'scholarship': scholarship['name'],
+            'amount': scholarship.get('amount', 'Varies'),
+            'category': scholarship.get('category', 'General'),
+            'failure_reason': format_reasons([reason_code])[0]
+        })
     
     return failures
 
 
+def evaluate(user_profile: Dict[str, Any], scholarships, min_match_threshold: int = 40,
+             top_k: Optional[int] = None,
+             n_jobs: int = 1) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Matches, hard filter failures and match statistics from a single scoring pass
+    
+    Same results as calling match_scholarships, get_hard_filter_failures and
+    get_scholarship_statistics one after another, but the scholarships are
+    scored only once.
+    
+    Args:
+        user_profile: User profile dictionary
+        scholarships: List of scholarship dictionaries or a prebuilt ScholarshipArrays
+        min_match_threshold: Minimum match percentage to include (default: 40%)
+        top_k: Only materialize the best top_k matches (default: all)
+        n_jobs: Number of scoring threads, see score_scholarships (default: 1)
+    
+    Returns:
+        Tuple of (matches, hard_failures, statistics)
+    """
+    if not isinstance(scholarships, ScholarshipArrays):
+        scholarships = build_scholarship_arrays(scholarships)
+    
+    user = _preprocess_user(user_profile)
+    
+    passed, scores = score_scholarships(user, scholarships, n_jobs)
+    failed_rows = np.flatnonzero(~passed)
+    
+    matches = _collect_matches(user, scholarships, passed, scores, min_match_threshold, top_k)
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_hard_failures(user, scholarships, failed_rows)
+    failures = _collect_failures(user, scholarships, failed_rows)
+    
+    return matches, failures, get_scholarship_statistics(matches)
+
+
 if __name__ == "__main__":
     # Test the matching algorithm with hard filters
     print("🧪 Testing Hard Filter Logic...\n")